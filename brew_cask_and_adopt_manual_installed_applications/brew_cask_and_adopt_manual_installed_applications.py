@@ -7,8 +7,60 @@ https://docs.brew.sh/Tips-N'-Tricks#appoint-homebrew-cask-to-manage-a-manually-i
 """
 
 import os
+import re
+import json
+import time
+import shutil
 import subprocess
+import tempfile
 import argparse
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from functools import lru_cache
+
+# Resolve the brew executable once instead of searching PATH for every call
+BREW = shutil.which("brew") or "brew"
+
+# Keep brew from updating itself or sending analytics on every call
+BREW_ENV = {
+    **os.environ,
+    "HOMEBREW_NO_AUTO_UPDATE": "1",
+    "HOMEBREW_NO_ANALYTICS": "1",
+}
+
+# Searched cask names change rarely, so brew search results are cached on disk
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "brew-adopt")
+SEARCH_CACHE_FILE = os.path.join(CACHE_DIR, "search.json")
+SEARCH_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days in seconds
+
+# Index of all casks published by Homebrew, used to search casks without brew
+CASK_INDEX_URL = "https://formulae.brew.sh/api/cask.json"
+CASK_INDEX_FILE = os.path.join(CACHE_DIR, "cask.json")
+CASK_INDEX_TTL = 24 * 60 * 60  # The index is updated daily
+
+# Define a timeout for requests in seconds
+TIMEOUT = 30
+
+# Default number of brew downloads and installations to run at the same time
+MAX_INSTALL_WORKERS = 3
+
+# Default Apple apps that should be skipped
+DEFAULT_APPLE_APPS = frozenset(
+    {
+        "garageband",
+        "keynote",
+        "safari",
+        "numbers",
+        "imovie",
+        "pages",
+    }
+)  # Add more apps as needed
+
+# Accepted answers for yes/no prompts
+YES_ANSWERS = frozenset({"yes", "y"})
+NO_ANSWERS = frozenset({"no", "n", ""})
 
 
 # ANSI color codes for terminal output
@@ -41,47 +93,303 @@ def list_installed_apps(applications_path):
         applications_path (str): Path to the directory containing installed applications.
 
     Returns:
-        list: List of installed application filenames ending with '.app'.
+        list: List of installed application bundle names ending with '.app'.
     """
-    return [f for f in os.listdir(applications_path) if f.endswith(".app")]
+    with os.scandir(applications_path) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".app") and entry.is_dir()
+        ]
 
 
-def brew_search(app_name):
+@lru_cache(maxsize=None)
+def app_name_variations(app_name):
     """
-    Search for an application available as a Homebrew cask.
+    Build the cask name variations to search for a given application name.
+
+    The result is memoized as it is needed for the installed check, the search
+    and the lookup of the search results of every application.
 
     Args:
-        app_name (str): Name of the application to check.
+        app_name (str): Name of the application.
 
     Returns:
-        list: List of available cask applications found for the given application name.
+        tuple: Possible cask names for the application.
     """
-    applications = []
+    if " " not in app_name:
+        return (app_name,)
+    # Split once and join the words for both variations instead of replacing twice
+    words = app_name.split(" ")
+    return ("-".join(words), "".join(words))
 
-    try:
-        result = subprocess.run(
-            ["brew", "search", "--cask", app_name],
-            capture_output=True,
+
+def simplify_name(name):
+    """
+    Simplify a name the same way `brew search` does before comparing it.
+
+    Args:
+        name (str): The name to simplify.
+
+    Returns:
+        str: The lowercase name with everything but letters, digits, "@" and "+" removed.
+    """
+    return re.sub(r"[^a-z\d@+]", "", name.lower())
+
+
+def brew_search_many(names):
+    """
+    Search for multiple applications available as Homebrew casks with a single
+    `brew search` invocation.
+
+    `brew search` joins multiple terms into one query, so all names are combined
+    into a single regular expression which mimics the substring matching brew
+    does for plain text searches. The hits are assigned back to the names afterwards.
+
+    Args:
+        names (list): Names of the applications to search for.
+
+    Returns:
+        dict: Mapping of each name to a list of available casks found for it,
+        empty if the search failed.
+    """
+    applications = {name: [] for name in names}
+    # Names without letters or digits are left out, as they would match every cask
+    simplified_names = {name: simplify_name(name) for name in names}
+    simplified_names = {
+        name: simplified for name, simplified in simplified_names.items() if simplified
+    }
+    if not simplified_names:
+        return applications
+
+    # Allow the characters brew ignores between every character of the names
+    patterns = {
+        "[^a-z\\d@+]*".join(re.escape(char) for char in simplified)
+        for simplified in simplified_names.values()
+    }
+    query = f"/{'|'.join(sorted(patterns))}/"
+
+    # Assign casks while brew is still printing instead of buffering the whole output,
+    # warnings go to a file so brew never blocks on a full stderr pipe meanwhile
+    with tempfile.TemporaryFile(mode="w+", errors="replace") as stderr_file:
+        with subprocess.Popen(
+            [BREW, "search", "--cask", query],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
             text=True,
-            check=True,
-        )
+            env=BREW_ENV,
+        ) as process:
+            for line in process.stdout:
+                cask = line.strip()
+                # Skip empty lines and section headers like "==> Casks"
+                if not cask or cask.startswith("==>"):
+                    continue
+                simplified_cask = simplify_name(cask)
+                for name, simplified in simplified_names.items():
+                    if simplified in simplified_cask:
+                        applications[name].append(cask)
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    if process.returncode != 0 and "No formulae or casks found" not in stderr:
+        print_colored(f"Brew search failed:\n{stderr.strip()}", Colors.RED)
+        return {}
 
-        if "Error: No formulae or casks found for" not in result.stdout:
-            applications.extend(result.stdout.splitlines())
-    except subprocess.CalledProcessError as e:
-        print_colored(
-            f'Brew search failed for "{app_name}":\n{e.stderr.strip()}', Colors.RED
-        )
+    return applications
+
+
+def load_search_cache(cache_file):
+    """
+    Load cached brew search results which are not expired yet.
+
+    Args:
+        cache_file (str): Path to the JSON cache file.
+
+    Returns:
+        dict: Mapping of searched names to a list of the search timestamp and the casks found.
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    now = time.time()
+    # Ignore cache files with unexpected contents
+    try:
+        return {
+            name: entry
+            for name, entry in cache.items()
+            if now - entry[0] < SEARCH_CACHE_TTL
+        }
+    except (AttributeError, KeyError, TypeError, IndexError):
+        return {}
+
+
+def save_search_cache(cache, cache_file):
+    """
+    Save brew search results to the cache file.
+
+    Args:
+        cache (dict): Mapping of searched names to a list of the search timestamp and the casks found.
+        cache_file (str): Path to the JSON cache file.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as file:
+            json.dump(cache, file)
+    except OSError as e:
+        print_colored(f"Could not write search cache {cache_file}: {e}", Colors.RED)
+
+
+def brew_search_cached(names, cache_file=SEARCH_CACHE_FILE, refresh=False):
+    """
+    Search for applications available as Homebrew casks, using cached results
+    where possible and searching brew only for the remaining names.
+
+    Args:
+        names (list): Names of the applications to search for.
+        cache_file (str): Path to the JSON cache file.
+        refresh (bool): Ignore cached results and search all names again.
 
+    Returns:
+        dict: Mapping of each name to a list of available casks found for it.
+    """
+    cache = {} if refresh else load_search_cache(cache_file)
+    missing_names = [name for name in dict.fromkeys(names) if name not in cache]
+
+    if missing_names:
+        now = time.time()
+        for name, casks in brew_search_many(missing_names).items():
+            cache[name] = [now, casks]
+        save_search_cache(cache, cache_file)
+
+    return {name: cache[name][1] for name in names if name in cache}
+
+
+def download_cask_index(index_file=CASK_INDEX_FILE, refresh=False):
+    """
+    Download the Homebrew cask index unless the local copy is still up to date.
+
+    Args:
+        index_file (str): Path to the local copy of the cask index.
+        refresh (bool): Check for a newer index even if the local copy is recent.
+
+    Returns:
+        bool: True if a local copy of the cask index is available.
+    """
+    if os.path.exists(index_file):
+        modified = os.path.getmtime(index_file)
+        if not refresh and time.time() - modified < CASK_INDEX_TTL:
+            return True
+        headers = {"If-Modified-Since": formatdate(modified, usegmt=True)}
+    else:
+        headers = {}
+
+    request = urllib.request.Request(CASK_INDEX_URL, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+            data = response.read()
+        os.makedirs(os.path.dirname(index_file), exist_ok=True)
+        with open(index_file, "wb") as file:
+            file.write(data)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            print_colored(f"Could not download cask index: {e}", Colors.RED)
+            return os.path.exists(index_file)
+        # Not modified, so the local copy is up to date for another day
+        os.utime(index_file)
+    except (urllib.error.URLError, OSError) as e:
+        print_colored(f"Could not download cask index: {e}", Colors.RED)
+        return os.path.exists(index_file)
+
+    return True
+
+
+def load_cask_index(index_file=CASK_INDEX_FILE, refresh=False):
+    """
+    Load the Homebrew cask index for searching casks locally.
+
+    Args:
+        index_file (str): Path to the local copy of the cask index.
+        refresh (bool): Check for a newer index even if the local copy is recent.
+
+    Returns:
+        dict or None: Mapping of cask names to their simplified token and names,
+        None if the index is not available.
+    """
+    if not download_cask_index(index_file, refresh):
+        return None
+
+    try:
+        with open(index_file, "r", encoding="utf-8") as file:
+            casks = json.load(file)
+    except (OSError, ValueError) as e:
+        print_colored(f"Could not read cask index {index_file}: {e}", Colors.RED)
+        return None
+
+    return {
+        cask["token"]: {
+            simplify_name(name) for name in [cask["token"], *cask.get("name", [])]
+        }
+        for cask in casks
+    }
+
+
+def search_cask_index(index, names):
+    """
+    Search the Homebrew cask index for multiple applications.
+
+    Like `brew search`, a cask matches if its simplified token or one of its
+    simplified names contains the simplified application name.
+
+    Args:
+        index (dict): Mapping of cask names to their simplified token and names.
+        names (list): Names of the applications to search for.
+
+    Returns:
+        dict: Mapping of each name to a list of available casks found for it.
+    """
+    applications = {}
+    for name in names:
+        simplified = simplify_name(name)
+        # An empty name would be contained in every cask
+        if not simplified:
+            applications[name] = []
+            continue
+        applications[name] = [
+            cask
+            for cask, cask_names in index.items()
+            if any(simplified in cask_name for cask_name in cask_names)
+        ]
     return applications
 
 
+def search_casks(names, refresh=False):
+    """
+    Search for applications available as Homebrew casks in the cask index,
+    falling back to `brew search` if the index is not available.
+
+    Args:
+        names (list): Names of the applications to search for.
+        refresh (bool): Ignore cached search results and outdated cask indexes.
+
+    Returns:
+        dict: Mapping of each name to a list of available casks found for it.
+    """
+    index = load_cask_index(refresh=refresh)
+    if index is None:
+        return brew_search_cached(names, refresh=refresh)
+    return search_cask_index(index, dict.fromkeys(names))
+
+
 def choose_alternative_cask(cask_names, original_name):
     """
     Prompt the user to choose an alternative cask from a list of cask names.
 
     Args:
-        cask_names (list): List of cask names from the brew search command.
+        cask_names (tuple): Cask names from the brew search command.
         original_name (str): The original app name to search for.
 
     Returns:
@@ -104,30 +412,38 @@ def choose_alternative_cask(cask_names, original_name):
         return None
 
 
-def check_cask_available(app_name):
+def find_cask_candidates(app_name, search_results):
     """
-    Check if a Homebrew Cask is available for the given application name.
+    Collect all casks found for the name variations of an application.
 
     Args:
         app_name (str): Name of the application to check.
+        search_results (dict): Mapping of searched names to the casks found for them.
 
     Returns:
-        str: The valid Homebrew Cask application name.
+        tuple: Sorted names of the casks found for the application.
     """
     cask_findings = set()
-    if " " in app_name:
-        app_name_variations = [app_name.replace(" ", "-"), app_name.replace(" ", "")]
-        for variation in app_name_variations:
-            search_result = brew_search(variation)
-            if search_result:
-                cask_findings.update(search_result)
-    else:
-        search_result = brew_search(app_name)
-        if search_result:
-            cask_findings.update(search_result)
+    for variation in app_name_variations(app_name):
+        cask_findings.update(search_results.get(variation, []))
+    return tuple(sorted(cask_findings))
 
-    cask_findings = sorted(list(cask_findings))
 
+@lru_cache(maxsize=None)
+def check_cask_available(app_name, cask_findings):
+    """
+    Check if a Homebrew Cask is available for the given application name.
+
+    The result is memoized, so an application name is only resolved (and the user
+    only asked for an alternative) once per run.
+
+    Args:
+        app_name (str): Name of the application to check.
+        cask_findings (tuple): Sorted names of the casks found for the application.
+
+    Returns:
+        str: The valid Homebrew Cask application name.
+    """
     if app_name in cask_findings:
         return app_name
     elif cask_findings:
@@ -136,21 +452,40 @@ def check_cask_available(app_name):
         return None
 
 
-def brew_install(app_name, install_dir, mode="adopt", retry_count=0):
+def brew_fetch(app_name):
     """
-    Install or adopt an application using Homebrew Cask.
+    Download an application with Homebrew Cask ahead of its installation.
+
+    Args:
+        app_name (str): Name of the application to download.
+
+    Returns:
+        bool: True if the download was successful, False otherwise.
+    """
+    result = subprocess.run(
+        [BREW, "fetch", "--cask", app_name],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        env=BREW_ENV,
+    )
+    return result.returncode == 0
+
+
+def run_brew_install(app_name, install_dir, mode="adopt"):
+    """
+    Run the Homebrew Cask installation of an application without any user interaction.
 
     Args:
         app_name (str): Name of the application to install or adopt.
         install_dir (str): Directory where the application should be installed.
         mode (str): Installation mode, either "adopt" or "force".
-        retry_count (int): Current retry attempt count to avoid infinity loop.
 
     Returns:
-        bool: True if installation or adoption was successful, False otherwise.
+        bytes or None: The error output of brew if the installation failed, None otherwise.
     """
     install_command = [
-        "brew",
+        BREW,
         "install",
         "--cask",
         app_name,
@@ -160,45 +495,121 @@ def brew_install(app_name, install_dir, mode="adopt", retry_count=0):
     ]
 
     try:
+        # Only stderr is inspected, and it is kept as bytes unless it has to be shown
         subprocess.run(
             install_command,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True,
+            env=BREW_ENV,
         )
-        return True
+        return None
     except subprocess.CalledProcessError as e:
-        if "It seems the existing App is different" in e.stderr and retry_count < 1:
-            if prompt_yes_no(
-                "It seems the existing App is different from the one being installed.\nDo you want to force install?"
-            ):
-                return brew_install(
-                    app_name, install_dir, mode="force", retry_count=retry_count + 1
-                )
+        return e.stderr
 
-        print_colored(
-            f'Installation failed for "{app_name}":\n{e.stderr.strip()}',
-            Colors.RED,
-        )
-        return False
 
+def run_brew_install_after_fetch(app_name, install_dir, download):
+    """
+    Run the Homebrew Cask installation of an application once its download finished.
+
+    A failed download is not handled here, brew reports the error again on installation.
+
+    Args:
+        app_name (str): Name of the application to install or adopt.
+        install_dir (str): Directory where the application should be installed.
+        download (concurrent.futures.Future): The pending download of the application.
 
-def is_managed_by_brew(app_name):
+    Returns:
+        bytes or None: The error output of brew if the installation failed, None otherwise.
     """
-    Check if an application is managed by Homebrew Cask.
+    download.result()
+    return run_brew_install(app_name, install_dir)
+
+
+def handle_install_error(app_name, install_dir, error, retry_count=0):
+    """
+    Handle a failed installation, offering a forced installation if the existing
+    application differs from the one being installed.
 
     Args:
-        app_name (str): Name of the application to check.
+        app_name (str): Name of the application to install or adopt.
+        install_dir (str): Directory where the application should be installed.
+        error (bytes): The error output of the failed brew installation.
+        retry_count (int): Current retry attempt count to avoid infinity loop.
 
     Returns:
-        bool: True if the application is managed by Homebrew.
+        bool: True if the forced installation was successful, False otherwise.
+    """
+    if b"It seems the existing App is different" in error and retry_count < 1:
+        if prompt_yes_no(
+            "It seems the existing App is different from the one being installed.\nDo you want to force install?"
+        ):
+            return brew_install(
+                app_name, install_dir, mode="force", retry_count=retry_count + 1
+            )
+
+    print_colored(
+        f'Installation failed for "{app_name}":\n'
+        f'{error.decode(errors="replace").strip()}',
+        Colors.RED,
+    )
+    return False
+
+
+def brew_install(app_name, install_dir, mode="adopt", retry_count=0):
+    """
+    Install or adopt an application using Homebrew Cask.
+
+    Args:
+        app_name (str): Name of the application to install or adopt.
+        install_dir (str): Directory where the application should be installed.
+        mode (str): Installation mode, either "adopt" or "force".
+        retry_count (int): Current retry attempt count to avoid infinity loop.
+
+    Returns:
+        bool: True if installation or adoption was successful, False otherwise.
+    """
+    error = run_brew_install(app_name, install_dir, mode)
+    if error is None:
+        return True
+    return handle_install_error(app_name, install_dir, error, retry_count)
+
+
+def list_brew_casks():
+    """
+    List all applications installed via Homebrew Cask.
+
+    Casks from third-party taps are included with both their full name
+    (e.g. "user/tap/cask") and their short name.
+
+    Returns:
+        set: Names of all casks installed via Homebrew.
     """
     result = subprocess.run(
-        ["brew", "list", "--cask", "--versions", app_name],
+        [BREW, "list", "--cask", "--full-name"],
         capture_output=True,
         text=True,
+        env=BREW_ENV,
     )
-    return app_name in result.stdout
+    installed_casks = set()
+    for full_name in result.stdout.split():
+        installed_casks.add(full_name)
+        installed_casks.add(full_name.rsplit("/", 1)[-1])
+    return installed_casks
+
+
+def is_managed_by_brew(app_name, installed_casks):
+    """
+    Check if an application is managed by Homebrew Cask.
+
+    Args:
+        app_name (str): Name of the application to check.
+        installed_casks (set): Names of all casks installed via Homebrew.
+
+    Returns:
+        bool: True if the application is managed by Homebrew.
+    """
+    return app_name in installed_casks
 
 
 def is_default_apple_app(app_name):
@@ -211,15 +622,7 @@ def is_default_apple_app(app_name):
     Returns:
         bool: True if the application is a default Apple app.
     """
-    default_apps = [
-        "garageband",
-        "keynote",
-        "safari",
-        "numbers",
-        "imovie",
-        "pages",
-    ]  # Add more apps as needed
-    return app_name.lower() in default_apps
+    return app_name.lower() in DEFAULT_APPLE_APPS
 
 
 def prompt_yes_no(question):
@@ -234,68 +637,136 @@ def prompt_yes_no(question):
     """
     while True:
         response = input(f"{question} (y/N): ").strip().lower()
-        if response in ["yes", "y"]:
+        if response in YES_ANSWERS:
             return True
-        elif response in ["no", "n", ""]:
+        elif response in NO_ANSWERS:
             return False
         else:
             print("Invalid response. Please answer 'yes' or 'no'.")
 
 
-def main(install_dir, manually):
+def main(install_dir, manually, refresh_cache=False, jobs=MAX_INSTALL_WORKERS):
     """
     Main function to manage installed applications using Homebrew Cask.
 
     Args:
         install_dir (str): Directory where applications are installed.
         manually (bool): Whether to prompt for adoption confirmation.
+        refresh_cache (bool): Whether to ignore cached search results and update the cask index.
+        jobs (int): Number of brew downloads and installations to run at the same time.
     """
     print("Checking for installed applications...")
     installed_apps = list_installed_apps(install_dir)
+    installed_casks = list_brew_casks()
     non_brew_managed_apps = []
+    apps_to_check = []
+    apps_to_install = []
+    # Casks queued for installation, so applications resolving to the same
+    # cask do not install it a second time at the same time
+    queued_casks = set()
 
     for app in installed_apps:
         # Split path and extract app name only
         app_name = os.path.splitext(app)[0].lower()
 
-        print("")
-
         # Skip if application is an Apple app
         if is_default_apple_app(app_name):
             print(f'Skipping default Apple app "{app_name}"')
             continue
 
-        print(f'Checking for "{app_name}"...')
+        # Skip the search if the application is already managed by Homebrew
+        if any(
+            is_managed_by_brew(variation, installed_casks)
+            for variation in app_name_variations(app_name)
+        ):
+            print(f'"{app_name}" is already installed and managed via Homebrew.')
+            continue
+
+        apps_to_check.append(app_name)
+
+    # Skip downloading the cask index if all applications are managed or skipped
+    search_results = {}
+    if apps_to_check:
+        print("Searching for available casks...")
+        search_results = search_casks(
+            [
+                variation
+                for app_name in apps_to_check
+                for variation in app_name_variations(app_name)
+            ],
+            refresh=refresh_cache,
+        )
 
-        # Check for valid cask name or suggest alternative name
-        brew_cask_app_name = check_cask_available(app_name)
+    # Download casks in the background while the remaining applications are checked
+    download_executor = ThreadPoolExecutor(max_workers=jobs)
+    downloads = []
 
-        # No valid alternative chosen or skipped
-        if brew_cask_app_name is None:
-            print_colored(f'"{app_name}" is not available as a cask.', Colors.RED)
-            non_brew_managed_apps.append(app_name)
-            continue
+    try:
+        for app_name in apps_to_check:
+            print("")
+            print(f'Checking for "{app_name}"...')
 
-        # Application already managed by Homebrew
-        if is_managed_by_brew(brew_cask_app_name):
-            print(
-                f'"{brew_cask_app_name}" is already installed and managed via Homebrew.'
+            # Check for valid cask name or suggest alternative name
+            brew_cask_app_name = check_cask_available(
+                app_name, find_cask_candidates(app_name, search_results)
             )
-            continue
 
-        # For manually mode prompt to ask for adoption
-        if manually and not prompt_yes_no(
-            f'Do you want to adopt "{brew_cask_app_name}"?'
-        ):
-            continue
+            # No valid alternative chosen or skipped
+            if brew_cask_app_name is None:
+                print_colored(f'"{app_name}" is not available as a cask.', Colors.RED)
+                non_brew_managed_apps.append(app_name)
+                continue
+
+            # Application already managed by Homebrew
+            if is_managed_by_brew(brew_cask_app_name, installed_casks):
+                print(
+                    f'"{brew_cask_app_name}" is already installed and managed via '
+                    "Homebrew."
+                )
+                continue
+
+            # Cask already queued for installation by another application
+            if brew_cask_app_name in queued_casks:
+                print(f'"{brew_cask_app_name}" is already queued for installation.')
+                continue
 
-        # Try to install application with Homebrew
-        print(f'Trying to install "{brew_cask_app_name}" with Homebrew...')
-        if brew_install(brew_cask_app_name, install_dir):
-            print_colored(
-                f'Installation of "{brew_cask_app_name}" succeeded!', Colors.GREEN
+            # For manually mode prompt to ask for adoption
+            if manually and not prompt_yes_no(
+                f'Do you want to adopt "{brew_cask_app_name}"?'
+            ):
+                continue
+
+            apps_to_install.append(brew_cask_app_name)
+            queued_casks.add(brew_cask_app_name)
+            downloads.append(download_executor.submit(brew_fetch, brew_cask_app_name))
+    except BaseException:
+        # Stop queued downloads when the user aborts at a prompt
+        download_executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    # Install concurrently, prompting for forced installations one at a time afterwards
+    with download_executor, ThreadPoolExecutor(max_workers=jobs) as executor:
+        installations = []
+        for brew_cask_app_name, download in zip(apps_to_install, downloads):
+            print(f'Trying to install "{brew_cask_app_name}" with Homebrew...')
+            installations.append(
+                executor.submit(
+                    run_brew_install_after_fetch,
+                    brew_cask_app_name,
+                    install_dir,
+                    download,
+                )
             )
 
+        for brew_cask_app_name, installation in zip(apps_to_install, installations):
+            error = installation.result()
+            if error is None or handle_install_error(
+                brew_cask_app_name, install_dir, error
+            ):
+                print_colored(
+                    f'Installation of "{brew_cask_app_name}" succeeded!', Colors.GREEN
+                )
+
     if non_brew_managed_apps:
         print_colored("\nApplications not found as Homebrew casks:\n", Colors.RED)
         for app in non_brew_managed_apps:
@@ -322,6 +793,25 @@ if __name__ == "__main__":
         action="store_true",
         help="Prompt for adoption confirmation (default: False)",
     )
+    parser.add_argument(
+        "-r",
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached search results and update the cask index (default: False)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=MAX_INSTALL_WORKERS,
+        help=(
+            "Number of applications to download and install at the same time "
+            f"(default: {MAX_INSTALL_WORKERS})"
+        ),
+    )
     args = parser.parse_args()
 
-    main(args.install_dir, args.manually)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    main(args.install_dir, args.manually, args.refresh_cache, args.jobs)
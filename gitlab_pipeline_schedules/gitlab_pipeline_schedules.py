@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of projects to query for pipeline schedules at the same time
+MAX_WORKERS = 16
 
 
 class GitLabAPI:
@@ -10,27 +15,33 @@ class GitLabAPI:
         self.gitlab_url = gitlab_url + "/api/v4"
         self.access_token = access_token
         self.headers = {"Authorization": f"Bearer {self.access_token}"}
+        # Reuse connections across requests, with one per concurrent worker
+        # and one for the main thread listing the projects
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS + 1)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def list_projects(self, per_page=50, order_by="id", sort="asc"):
         """
         List all projects accessible by the user using keyset pagination.
+        The projects are yielded page by page as soon as each page is received.
         """
-        projects = []
         url = f"{self.gitlab_url}/projects?pagination=keyset&per_page={per_page}&order_by={order_by}&sort={sort}"
 
         while url:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response_data = self._handle_response(response)
-            projects.extend(response_data)
+            yield from response_data
             url = self._get_next_page_url(response)
-        return projects
 
     def get_pipeline_schedules(self, project_id, per_page=1000):
         """
         Get active pipeline schedules for a specific project.
         """
         url = f"{self.gitlab_url}/projects/{project_id}/pipeline_schedules?per_page={per_page}&scope=active"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         return self._handle_response(response)
 
     def _handle_response(self, response):
@@ -50,14 +61,7 @@ class GitLabAPI:
         """
         Extract the next page URL from the Link header.
         """
-        link_header = response.headers.get("Link")
-        if link_header:
-            links = link_header.split(",")
-            for link in links:
-                if 'rel="next"' in link:
-                    next_url = link[link.find("<") + 1 : link.find(">")]
-                    return next_url
-        return None
+        return response.links.get("next", {}).get("url")
 
 
 def main(gitlab_url, access_token, owner):
@@ -66,16 +70,19 @@ def main(gitlab_url, access_token, owner):
     # List all projects
     projects = gitlab.list_projects()
 
-    for project in projects:
-        project_id = project["id"]
-        # Get active pipeline schedules for each project
-        schedules = gitlab.get_pipeline_schedules(project_id)
-
-        if schedules:
-            for schedule in schedules:
-                # Check for schedule owner
-                if schedule["owner"]["username"] == owner:
-                    print(json.dumps(schedule))
+    # Get active pipeline schedules for all projects concurrently, the
+    # projects of the first pages are queried while later pages are listed
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        project_schedules = executor.map(
+            gitlab.get_pipeline_schedules, (project["id"] for project in projects)
+        )
+
+        for schedules in project_schedules:
+            if schedules:
+                for schedule in schedules:
+                    # Check for schedule owner
+                    if schedule["owner"]["username"] == owner:
+                        print(json.dumps(schedule))
 
 
 if __name__ == "__main__":
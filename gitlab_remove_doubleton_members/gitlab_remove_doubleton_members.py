@@ -7,8 +7,10 @@ including those in subgroups.
 """
 
 import argparse
+import itertools
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import gitlab
 from urllib3.exceptions import InsecureRequestWarning
 from colorama import Fore, Style
@@ -20,163 +22,216 @@ warnings.simplefilter("ignore", InsecureRequestWarning)
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+# Number of repositories or pages to process at the same time
+MAX_WORKERS = 8
+
+# Number of members to remove at the same time, GitLab limits write requests
+# more strictly than read requests
+MAX_DELETE_WORKERS = 4
+
+# Number of items to request per page, the maximum GitLab allows
+PER_PAGE = 100
+
+# Maximum number of user IDs to filter repository members by on the server,
+# more IDs would exceed the URL length limits of GitLab
+MAX_FILTER_USER_IDS = 100
 
-def get_paginated_data(get_function, **kwargs):
-    """Helper function to handle paginated API results."""
-    all_data = []
-    page = 1
-    while True:
-        data = get_function(page=page, per_page=100, **kwargs)
-        if not data:
-            break
-        all_data.extend(data)
-        page += 1
-    return all_data
 
+def list_all(manager, concurrent=True, **kwargs):
+    """List all objects of a manager, fetching all pages after the first one
+    concurrently once the total number of pages is known.
 
-def get_all_groups(gl, group_id):
-    """Fetch all groups under the specified group ID."""
-    all_groups = []
-    group = gl.groups.get(group_id)
-    all_groups.append(group)
+    Callers that already run inside a worker pass concurrent=False to fetch
+    the pages one by one, so nested pools do not exceed MAX_WORKERS requests."""
+    pages = manager.list(iterator=True, per_page=PER_PAGE, **kwargs)
+    total_pages = pages.total_pages
 
-    # Recursively get subgroups
-    subgroups = get_paginated_data(group.subgroups.list)
-    for subgroup in subgroups:
-        all_groups.append(subgroup)
-        all_groups.extend(get_all_groups(gl, subgroup.id))
+    # GitLab omits the total for very large collections, so follow the pages one by one
+    if not concurrent or not total_pages or total_pages <= 1:
+        return list(pages)
+
+    # Take the items of the already fetched first page without requesting the next one
+    all_data = list(itertools.islice(pages, pages.per_page or PER_PAGE))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        remaining_pages = executor.map(
+            lambda page: manager.list(page=page, per_page=PER_PAGE, **kwargs),
+            range(2, total_pages + 1),
+        )
+        for data in remaining_pages:
+            all_data.extend(data)
+    return all_data
 
-    return all_groups
 
+def get_all_groups(group):
+    """Fetch the specified group and all groups under it."""
+    # The descendant groups contain the subgroups of all levels, so the
+    # group tree does not have to be walked one subgroup at a time
+    return [group, *list_all(group.descendant_groups)]
 
-def get_group_members(gl, group_id):
-    """Get all members of a group, including inherited members."""
-    group = gl.groups.get(group_id)
-    members = get_paginated_data(group.members.list)
+
+def get_group_members(gl, group):
+    """Get an iterator over all members of a group, including inherited members."""
+    lazy_group = gl.groups.get(group.id, lazy=True)
     logging.info(
-        "Fetched group members for group %s (URL: %s)", group_id, group.web_url
+        "Fetching group members for group %s (URL: %s)", group.id, group.web_url
     )
-    return members
+    return lazy_group.members.list(iterator=True, per_page=PER_PAGE)
+
 
+def get_repo_members(project, user_ids=None):
+    """Get all direct members of a repository (project), optionally only
+    those with one of the given user IDs."""
+    # Let GitLab filter the members if the IDs fit into the request, so
+    # repositories without any matching member return an empty page
+    if user_ids and len(user_ids) <= MAX_FILTER_USER_IDS:
+        return list_all(project.members, concurrent=False, user_ids=sorted(user_ids))
 
-def get_repo_members(gl, repo_id):
-    """Get all direct members of a repository (project)."""
-    project = gl.projects.get(repo_id)
-    return get_paginated_data(project.members.list)
+    # Repositories are already processed concurrently, so fetch the pages one by one
+    return list_all(project.members, concurrent=False)
 
 
-def get_group_projects(gl, group_id):
+def get_group_projects(group):
     """Get all projects in a group, including those in subgroups."""
-    group = gl.groups.get(group_id)
-    all_projects = get_paginated_data(group.projects.list)
+    return list_all(group.projects, include_subgroups=True)
+
+
+def process_project(
+    gl, project, all_group_member_ids, dry_run, exclude_users=frozenset()
+):
+    """Find direct members of a single repository that already have
+    inherited permissions through one of the groups and return those to remove."""
+    # The listed project already contains all needed data, so only a lazy
+    # project object without an additional request is needed for its members
+    lazy_project = gl.projects.get(project.id, lazy=True)
+    project_url = project.web_url  # Get the project URL
+    logging.info(
+        "Processing repository %s (ID: %s, URL: %s)",
+        project.name,
+        project.id,
+        project_url,
+    )
 
-    # Recursively get projects from subgroups
-    subgroups = get_paginated_data(group.subgroups.list)
-    for subgroup in subgroups:
+    # Get direct members of the project
+    repo_members = get_repo_members(lazy_project, all_group_member_ids)
+
+    # Construct the URL for the members tab of the project
+    members_url = f"{gl.url}/{project.path_with_namespace}/-/project_members"
+
+    members_to_remove = []
+    for member in repo_members:
+        if member.id in all_group_member_ids:
+            # Check if the member is in the exclude list
+            if member.username in exclude_users:
+                logging.info(
+                    Fore.LIGHTBLUE_EX
+                    + "Skipping member %s as they are in the exclude list for repository %s"
+                    + Style.RESET_ALL,
+                    member.username,
+                    project.name,
+                )
+                continue
+
+            if dry_run:
+                logging.info(
+                    Fore.YELLOW
+                    + "Dry-run: Would remove directly added member %s from repository %s (%s) "
+                    + "as they already have inherited access."
+                    + Style.RESET_ALL,
+                    member.username,
+                    project.name,
+                    members_url,
+                )
+            else:
+                members_to_remove.append(member)
+
+    return members_to_remove
+
+
+def remove_member(gl, project, member):
+    """Remove a direct member from a repository."""
+    lazy_project = gl.projects.get(project.id, lazy=True)
+    try:
         logging.info(
-            "Fetching projects from subgroup %s (ID: %s)", subgroup.name, subgroup.id
+            Fore.GREEN + "Removing member %s from repository %s" + Style.RESET_ALL,
+            member.username,
+            project.name,
+        )
+        lazy_project.members.delete(member.id)
+    except gitlab.exceptions.GitlabDeleteError as e:
+        logging.error(
+            "Failed to remove %s from %s: %s",
+            member.username,
+            project.name,
+            e,
         )
-        all_projects.extend(get_group_projects(gl, subgroup.id))
-
-    return all_projects
 
 
 def remove_direct_members(gl, group_id, dry_run, exclude_users=None):
     """Remove direct members of repositories that are part of the group
     and have inherited permissions."""
-    all_groups = get_all_groups(gl, group_id)
-    all_group_member_ids = set()
+    # Look up excluded usernames in a set, as every member of every repository is checked
+    exclude_users = frozenset(exclude_users or ())
+
+    top_group = gl.groups.get(group_id)
+    all_groups = get_all_groups(top_group)
 
-    # Collect all members from all groups for quick access
-    for group in all_groups:
-        members = get_group_members(gl, group.id)
-        all_group_member_ids.update(member.id for member in members)
+    # Collect all members from all groups for quick access, the members of
+    # the groups are fetched concurrently as each group needs its own requests
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        group_members = executor.map(
+            lambda group: list(get_group_members(gl, group)), all_groups
+        )
+        all_group_member_ids = frozenset(
+            member.id for members in group_members for member in members
+        )
 
     logging.info("Collected all group member IDs from specified group and subgroups.")
 
-    # Get all repositories in the group, including subgroups
+    # Without group members there is nothing to remove, so skip fetching repositories
+    if not all_group_member_ids:
+        logging.info("No group members found for group %s", group_id)
+        return
+
+    # Get all repositories in the group, including subgroups, GitLab lists
+    # every repository exactly once
     logging.info("Fetching repositories for group %s", group_id)
-    projects = get_group_projects(gl, group_id)
+    projects = get_group_projects(top_group)
 
     # Ensure that we have a valid list of projects
     if not projects:
         logging.info("No repositories found for group %s", group_id)
         return
 
-    processed_projects = set()  # Track processed project IDs
-
-    # Loop through each repository
-    for project in projects:
-        project_id = project.id
-
-        # Check if project has already been processed
-        if project_id in processed_projects:
-            logging.info(
-                "Skipping already processed project %s (ID: %s)",
-                project.name,
-                project_id,
+    # Process the repositories concurrently as each one waits on its own API requests
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                process_project,
+                gl,
+                project,
+                all_group_member_ids,
+                dry_run,
+                exclude_users,
             )
-            continue
+            for project in projects
+        ]
 
-        # Add to processed projects
-        processed_projects.add(project_id)
+    # Collect the members to remove, raising unexpected errors of any repository
+    members_to_remove = [
+        (project, member)
+        for project, future in zip(projects, futures)
+        for member in future.result()
+    ]
 
-        # Fetch project details to ensure complete data
-        project = gl.projects.get(project_id)  # Ensure we have all project data
-        project_url = project.web_url  # Get the project URL
-        logging.info(
-            "Processing repository %s (ID: %s, URL: %s)",
-            project.name,
-            project.id,
-            project_url,
-        )
+    # Remove the members concurrently with fewer workers than used for reading
+    with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+        futures = [
+            executor.submit(remove_member, gl, project, member)
+            for project, member in members_to_remove
+        ]
 
-        # Get direct members of the project
-        repo_members = get_repo_members(gl, project.id)
-
-        # Construct the URL for the members tab of the project
-        members_url = f"{gl.url}/{project.path_with_namespace}/-/project_members"
-
-        for member in repo_members:
-            if member.id in all_group_member_ids:
-                # Check if the member is in the exclude list
-                if exclude_users and member.username in exclude_users:
-                    logging.info(
-                        Fore.LIGHTBLUE_EX
-                        + "Skipping member %s as they are in the exclude list for repository %s"
-                        + Style.RESET_ALL,
-                        member.username,
-                        project.name,
-                    )
-                    continue
-
-                if dry_run:
-                    logging.info(
-                        Fore.YELLOW
-                        + "Dry-run: Would remove directly added member %s from repository %s (%s) "
-                        + "as they already have inherited access."
-                        + Style.RESET_ALL,
-                        member.username,
-                        project.name,
-                        members_url,
-                    )
-                else:
-                    try:
-                        logging.info(
-                            Fore.GREEN
-                            + "Removing member %s from repository %s"
-                            + Style.RESET_ALL,
-                            member.username,
-                            project.name,
-                        )
-                        project.members.delete(member.id)
-                    except gitlab.exceptions.GitlabDeleteError as e:
-                        logging.error(
-                            "Failed to remove %s from %s: %s",
-                            member.username,
-                            project.name,
-                            e,
-                        )
+    for future in futures:
+        future.result()
 
 
 def main():
@@ -223,7 +278,11 @@ def main():
 
     # Initialize GitLab connection
     gl = gitlab.Gitlab(
-        args.gitlab_url, private_token=args.access_token, ssl_verify=False
+        args.gitlab_url,
+        private_token=args.access_token,
+        ssl_verify=False,
+        # Retry requests failing because of rate limits or server errors
+        retry_transient_errors=True,
     )
 
     # Run the member cleanup process
@@ -5,14 +5,21 @@ A script to gather all installed python packages via `pip list`
 but only for specific requirement files
 """
 
+import re
 import sys
 from importlib.metadata import distributions
 from packaging.requirements import Requirement
+from packaging.utils import canonicalize_name
+
+# Comments start with a "#" at the beginning of a line or after whitespace,
+# the same way pip reads them
+COMMENT_PATTERN = re.compile(r"(^|\s+)#.*$")
 
 
 def read_requirements(file_path):
     """
     Reads the requirements file and returns a list of Requirement objects.
+    Comments, empty lines and pip options such as `-r` or `-e` are skipped.
 
     Args:
         file_path (str): The path to the requirements file.
@@ -20,9 +27,13 @@ def read_requirements(file_path):
     Returns:
         list: A list of Requirement objects.
     """
+    requirements = []
     with open(file_path, "r", encoding="utf-8") as file:
-        requirements = file.read().splitlines()
-    return [Requirement(req) for req in requirements]
+        for line in file:
+            line = COMMENT_PATTERN.sub("", line).strip()
+            if line and not line.startswith("-"):
+                requirements.append(Requirement(line))
+    return requirements
 
 
 def get_installed_packages():
@@ -30,9 +41,12 @@ def get_installed_packages():
     Returns a dictionary of installed packages with their versions.
 
     Returns:
-        dict: A dictionary where keys are package names and values are versions.
+        dict: A dictionary where keys are canonical package names and values are versions.
     """
-    return {dist.metadata["Name"].lower(): dist.version for dist in distributions()}
+    return {
+        canonicalize_name(dist.metadata["Name"]): dist.version
+        for dist in distributions()
+    }
 
 
 def main(req_file):
@@ -47,7 +61,7 @@ def main(req_file):
 
     print(f"Packages from {req_file} that are installed:")
     for req in requirements:
-        package_name = req.name.lower()
+        package_name = canonicalize_name(req.name)
         if package_name in installed_packages:
             installed_version = installed_packages[package_name]
             if req.specifier.contains(installed_version):
@@ -4,9 +4,14 @@
 A script to gather open pull requests from github.com that are in need of a review.
 """
 
+import os
 import json
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 import requests
+from requests.adapters import HTTPAdapter
 
 # GitHub API base URL
 BASE_URL = "https://api.github.com"
@@ -14,40 +19,204 @@ BASE_URL = "https://api.github.com"
 # Define a timeout for requests in seconds
 TIMEOUT = 30
 
+# Default number of requests to send to GitHub at the same time, more
+# concurrent requests trigger GitHub's secondary rate limits
+MAX_WORKERS = 8
 
-def get_user_repos(headers):
+# Number of items to request per page, the maximum GitHub allows
+PER_PAGE = 100
+
+# Number of times a rate limited request is retried
+MAX_RETRIES = 3
+
+# Seconds to wait after hitting a secondary rate limit without a Retry-After header
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+# Cache of the ETags and items of all requested pages, GitHub answers requests
+# for unchanged pages with "304 Not Modified" which do not count against the rate limit
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "pr_review", "pages.json")
+CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
+
+# Fields of the repositories and pull requests which are read and therefore cached
+CACHED_FIELDS = (
+    "full_name",
+    "open_issues_count",
+    "number",
+    "html_url",
+    "requested_reviewers",
+    "requested_teams",
+)
+
+
+def get_cached_fields(item):
+    """Get the fields of a repository or pull request which are cached"""
+    return {field: item[field] for field in CACHED_FIELDS if field in item}
+
+
+def load_cache(cache_file):
+    """
+    Load cached pages which have been requested recently.
+
+    Args:
+        cache_file (str): Path to the JSON cache file.
+
+    Returns:
+        dict: Mapping of page URLs to their last request timestamp, ETag, items and next page URL.
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    # Drop expired pages and fields which caches of older versions contain,
+    # a cache with unexpected contents is ignored like an unreadable one
+    now = time.time()
+    try:
+        return {
+            url: {
+                "time": entry["time"],
+                "etag": entry["etag"],
+                "items": [get_cached_fields(item) for item in entry["items"]],
+                "next": entry["next"],
+            }
+            for url, entry in cache.items()
+            if now - entry["time"] < CACHE_TTL
+        }
+    except (AttributeError, KeyError, TypeError):
+        return {}
+
+
+def save_cache(cache, cache_file):
+    """
+    Save requested pages to the cache file.
+
+    Args:
+        cache (dict): Mapping of page URLs to their last request timestamp, ETag, items and next page URL.
+        cache_file (str): Path to the JSON cache file.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_file), mode=0o700, exist_ok=True)
+        # Only the user may read the cache, as it contains private repositories
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.chmod(cache_file, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(cache, file)
+    except OSError as e:
+        print(f"Could not write cache {cache_file}: {e}")
+
+
+def get_rate_limit_wait(response):
+    """Get the seconds to wait before retrying a rate limited request,
+    None if the request was not rate limited"""
+    if response.status_code not in (403, 429):
+        return None
+    if "Retry-After" in response.headers:
+        return int(response.headers["Retry-After"])
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = int(response.headers.get("X-RateLimit-Reset", time.time()))
+        return max(reset - time.time(), 0) + 1
+    if "secondary rate limit" in response.text.lower():
+        return SECONDARY_RATE_LIMIT_WAIT
+    return None
+
+
+def send_request(url, params, session, headers=None):
+    """Send a GET request, waiting and retrying when a rate limit is hit"""
+    for attempt in range(MAX_RETRIES + 1):
+        response = session.get(url, params=params, headers=headers, timeout=TIMEOUT)
+        wait = get_rate_limit_wait(response)
+        if wait is None or attempt == MAX_RETRIES:
+            break
+        print(f"Rate limit hit, retrying in {wait:.0f} seconds: {response.url}")
+        time.sleep(wait)
+    response.raise_for_status()
+    return response
+
+
+def get_all_pages(url, params, session, cache):
+    """Get the items of all pages of a list endpoint by following the Link header,
+    reusing the cached items of pages that have not changed"""
+    # The next page URLs already contain all query parameters
+    url = requests.Request("GET", url, params={**params, "per_page": PER_PAGE})
+    url = url.prepare().url
+    items = []
+    while url:
+        cached = cache.get(url)
+        # Full last pages cached by older versions cannot be trusted either
+        if cached and not cached["next"] and len(cached["items"]) >= PER_PAGE:
+            cached = None
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        response = send_request(url, None, session, headers)
+        next_url = response.links.get("next", {}).get("url")
+        if response.status_code == 304:
+            entry = {**cached, "time": time.time(), "next": next_url or cached["next"]}
+        else:
+            entry = {
+                "time": time.time(),
+                "etag": response.headers.get("ETag"),
+                "items": [get_cached_fields(item) for item in response.json()],
+                "next": next_url,
+            }
+        # The ETag does not cover the Link header, so a full last page stays
+        # unchanged when a new page is added after it and is not cached
+        if entry["etag"] and (entry["next"] or len(entry["items"]) < PER_PAGE):
+            cache[url] = entry
+        else:
+            cache.pop(url, None)
+        items.extend(entry["items"])
+        url = entry["next"]
+    return items
+
+
+def get_user_repos(session, cache):
     """Get all repositories owned by the user (including private ones)"""
     url = f"{BASE_URL}/user/repos"
     params = {"visibility": "all", "affiliation": "owner"}
-    response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
-    response.raise_for_status()
-    return response.json()
+    return get_all_pages(url, params, session, cache)
 
 
-def get_org_repos(org, headers):
+def get_org_repos(org, session, cache):
     """Get all repositories for a given organization (including private ones)"""
     url = f"{BASE_URL}/orgs/{org}/repos"
     params = {"visibility": "all"}
-    response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
-    response.raise_for_status()
-    return response.json()
+    return get_all_pages(url, params, session, cache)
 
 
-def get_open_pull_requests(repo_full_name, headers):
+def get_owner_repos(owner, username, session, cache):
+    """Get all repositories of a user account or an organization account"""
+    # Fetch repositories for user account
+    if owner == username:
+        return get_user_repos(session, cache)
+    # Fetch repositories for organization account
+    return get_org_repos(owner, session, cache)
+
+
+def get_open_pull_requests(repo_full_name, session, cache):
     """Get all open pull requests for a given repository"""
     url = f"{BASE_URL}/repos/{repo_full_name}/pulls"
     params = {"state": "open"}
-    response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
-    response.raise_for_status()
-    return response.json()
+    return get_all_pages(url, params, session, cache)
+
+
+def get_repo_pull_requests(repo, session, cache):
+    """Get all open pull requests for a repository from a repository listing"""
+    # The open issues count includes pull requests, so a repository without
+    # open issues has no open pull requests to fetch
+    if repo.get("open_issues_count") == 0:
+        return []
+    return get_open_pull_requests(repo["full_name"], session, cache)
 
 
 def needs_review(pull_request):
     """Determine if a pull request needs review"""
-    return bool(pull_request["requested_reviewers"] or pull_request["requested_teams"])
+    # Missing or null reviewer lists count as no requested reviews
+    return bool(
+        pull_request.get("requested_reviewers") or pull_request.get("requested_teams")
+    )
 
 
-def main(username, token, owners, output_file=None):
+def main(username, token, owners, output_file=None, max_workers=MAX_WORKERS):
     """
     Main function to fetch open pull requests that need review.
 
@@ -56,6 +225,7 @@ def main(username, token, owners, output_file=None):
         token (str): GitHub personal access token.
         owners (list of str): List of user accounts and organization accounts to scan.
         output_file (str, optional): File to save formatted output. Defaults to None.
+        max_workers (int, optional): Number of concurrent requests. Defaults to MAX_WORKERS.
 
     """
     # Define headers for API requests
@@ -64,56 +234,72 @@ def main(username, token, owners, output_file=None):
         "Accept": "application/vnd.github.v3+json",
     }
 
+    # Reuse connections across requests, with one per concurrent worker
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(pool_maxsize=max_workers))
+
     # Create an empty dictionary to store repository information
     repos = {}
 
-    for owner in owners:
-        # Fetch repositories for user account
-        if owner == username:
-            user_repos = get_user_repos(headers)
-            for repo in user_repos:
-                repo_full_name = repo["full_name"]
-                print(f"Checking repository: {repo_full_name}")
-                pull_requests = get_open_pull_requests(repo_full_name, headers)
+    # Load the pages of previous runs to send conditional requests
+    cache = load_cache(CACHE_FILE)
 
-                # Update repository information with pull request details
-                repos[repo_full_name] = {
-                    "has_needing_review": any(needs_review(pr) for pr in pull_requests)
-                }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Collect all repositories to check, fetching the accounts concurrently
+        all_repos = [
+            repo
+            for owner_repos in executor.map(
+                get_owner_repos,
+                owners,
+                repeat(username),
+                repeat(session),
+                repeat(cache),
+            )
+            for repo in owner_repos
+        ]
 
-        else:
-            # Fetch repositories for organization account
-            org_repos = get_org_repos(owner, headers)
-            for repo in org_repos:
-                repo_full_name = repo["full_name"]
-                print(f"Checking repository: {repo_full_name}")
-                pull_requests = get_open_pull_requests(repo_full_name, headers)
-
-                # Update repository information with pull request details
-                repos[repo_full_name] = {
-                    "has_needing_review": any(needs_review(pr) for pr in pull_requests)
-                }
-
-    # Sort the dictionary based on the "has_needing_review" flag (descending)
-    sorted_repos = sorted(
-        repos.items(), key=lambda x: x[1]["has_needing_review"], reverse=True
-    )
+        # Fetch the open pull requests of all repositories concurrently
+        repo_pull_requests = executor.map(
+            get_repo_pull_requests, all_repos, repeat(session), repeat(cache)
+        )
+
+        for repo, pull_requests in zip(all_repos, repo_pull_requests):
+            repo_full_name = repo["full_name"]
+            print(f"Checking repository: {repo_full_name}")
+
+            # Update repository information with pull request details, the
+            # pull requests are kept to print them without fetching them again
+            repos[repo_full_name] = {
+                "pulls": pull_requests,
+                "has_needing_review": any(needs_review(pr) for pr in pull_requests),
+            }
+
+    save_cache(cache, CACHE_FILE)
+
+    # Only repositories with the "has_needing_review" flag are printed, so
+    # filter them in their original order instead of sorting all of them
+    repos_needing_review = [
+        (repo_name, info)
+        for repo_name, info in repos.items()
+        if info["has_needing_review"]
+    ]
 
     # Prepare the list of repositories with PRs needing review for output
     repos_with_needed_review_list = []
 
-    # Print repositories based on the sorted order
-    for repo_name, info in sorted_repos:
-        if info["has_needing_review"]:  # Check if review is needed
-            print(f"Repository: {repo_name}")
-            pull_requests = get_open_pull_requests(repo_name, headers)
-            repos_with_needed_review_list.append(f"Repository: {repo_name}")
-            for pr in pull_requests:
-                if needs_review(pr):
-                    print(f'  PR #{pr["number"]} needs review: {pr["html_url"]}')
-                    repos_with_needed_review_list.append(
-                        f'  PR #{pr["number"]} needs review: {pr["html_url"]}'
-                    )
+    # Collect the repositories that need a review
+    for repo_name, info in repos_needing_review:
+        repos_with_needed_review_list.append(f"Repository: {repo_name}")
+        for pr in info["pulls"]:
+            if needs_review(pr):
+                repos_with_needed_review_list.append(
+                    f'  PR #{pr["number"]} needs review: {pr["html_url"]}'
+                )
+
+    # Print all repositories that need a review with a single write
+    if repos_with_needed_review_list:
+        print("\n".join(repos_with_needed_review_list))
 
     # Save the formatted output to a file if output_file is provided
     if output_file:
@@ -139,7 +325,21 @@ if __name__ == "__main__":
         help="List of user accounts and organization accounts to scan",
     )
     parser.add_argument("--output-file", help="File to save formatted output")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Number of requests to send at the same time (default: {MAX_WORKERS})",
+    )
 
     args = parser.parse_args()
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
 
-    main(args.username, args.token, args.owners, args.output_file)
+    main(
+        args.username,
+        args.token,
+        args.owners,
+        args.output_file,
+        args.max_concurrency,
+    )
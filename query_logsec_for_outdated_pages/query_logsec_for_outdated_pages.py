@@ -6,9 +6,44 @@ for $X amount of days in your LogSeq graph
 """
 
 import os
+import time
 import datetime
-import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of files to read the modification time of at the same time, which
+# hides the latency of slow or network-hosted disks
+MAX_WORKERS = 16
+
+
+def walk(path):
+    """Recursively yield the directory entries of all files below a path,
+    skipping directories that cannot be read"""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk(entry.path)
+            else:
+                yield entry
+
+
+def starts_with_date(page_name):
+    """Check if a page name starts with a date in YYYY-MM-DD, YYYY_MM_DD,
+    or journals_YYYY_MM_DD format"""
+    name = page_name.removeprefix("journals_")
+    return (
+        len(name) >= 10
+        and name[:4].isdigit()
+        and name[4] in "-_"
+        and name[5:7].isdigit()
+        and name[7] in "-_"
+        and name[8:10].isdigit()
+    )
+
 
 # Set up command-line argument parsing
 parser = argparse.ArgumentParser(
@@ -23,36 +58,38 @@ args = parser.parse_args()
 logseq_path = args.logseq_path
 days_threshold = args.days_threshold
 
-# Regex pattern to exclude pages that start with a date in:
-# YYYY-MM-DD, YYYY_MM_DD, or journals_YYYY_MM_DD format
-exclude_pattern = re.compile(r"^(journals_)?\d{4}[-_]\d{2}[-_]\d{2}.*$")
-
-# Get current date
-now = datetime.datetime.now()
-
-# Find all pages
-pages = []
-for root, dirs, files in os.walk(logseq_path):
-    for file in files:
-        if file.endswith(".md"):
-            file_path = os.path.join(root, file)
-            page_name = os.path.basename(file).replace(".md", "")
-            # Exclude pages matching the specific pattern
-            if exclude_pattern.match(page_name):
-                continue
-            modification_time = os.path.getmtime(file_path)
+# Pages are outdated if they have not been modified for more than the
+# specified number of days, compare the raw timestamps against this cutoff
+cutoff = time.time() - (days_threshold + 1) * 86400
+
+# Find all pages, excluding journal pages that start with a date
+page_entries = [
+    entry
+    for entry in walk(logseq_path)
+    if entry.name.endswith(".md")
+    and not starts_with_date(entry.name.replace(".md", ""))
+]
+
+# Read the modification times concurrently
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    modification_times = executor.map(lambda entry: entry.stat().st_mtime, page_entries)
+
+    pages = []
+    for entry, modification_time in zip(page_entries, modification_times):
+        # Check if the page has not been modified in the specified number of days
+        if modification_time <= cutoff:
+            page_name = entry.name.replace(".md", "")
             modification_date = datetime.datetime.fromtimestamp(modification_time)
-            # Check if the page has not been modified in the specified number of days
-            if (now - modification_date).days > days_threshold:
-                pages.append((page_name, modification_date))
+            pages.append((page_name, modification_date))
 
 # Generate a LogSeq page with links to outdated pages
 output_path = os.path.join(logseq_path, "outdated-pages.md")
+lines = [f"# Pages not edited in the last {days_threshold} days\n"]
+lines.extend(
+    f"- [[{page_name}]] - last edited at {mod_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    for page_name, mod_date in pages
+)
 with open(output_path, "w", encoding="utf-8") as f:
-    f.write(f"# Pages not edited in the last {days_threshold} days\n")
-    for page_name, mod_date in pages:
-        f.write(
-            f"- [[{page_name}]] - last edited at {mod_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        )
+    f.write("".join(lines))
 
 print(f"Generated {output_path} with {len(pages)} outdated pages.")
@@ -4,55 +4,132 @@
 A script to search subreddits for a specific string.
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from urllib.parse import urlparse
 import argparse
 import praw
+from prawcore.exceptions import Forbidden, NotFound, Redirect
 from colorama import Fore, Style
 
+# Common image file extensions of URLs to exclude from the results
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif"})
+
+# Maximum number of subreddits to search at the same time
+MAX_WORKERS = 10
+
+# Time periods Reddit can restrict search results to
+TIME_FILTERS = ("all", "day", "hour", "month", "week", "year")
+
+# Reddit instance of each worker thread
+thread_data = threading.local()
+
 
 def is_image_url(url):
     """
-    Check if the given URL ends with a common image file extension.
+    Check if the path of the given URL ends with a common image file extension.
 
     :param url: URL string to check.
     :return: True if URL ends with an image extension, False otherwise.
     """
-    image_extensions = [".jpg", ".jpeg", ".png", ".gif"]
-    return any(url.lower().endswith(ext) for ext in image_extensions)
+    return os.path.splitext(urlparse(url).path)[1].lower() in IMAGE_EXTENSIONS
 
 
-def search_in_subreddits(reddit, subreddits, query, limit=10):
+def init_worker(credentials):
     """
-    Search for a specific string in a list of subreddits (excluding image URLs).
+    Create a Reddit instance for the current worker thread, as PRAW is not thread safe.
 
-    :param reddit: Initialized Reddit instance.
-    :param subreddits: List of subreddit names to search in.
+    :param credentials: Dictionary with the Reddit API client ID, client secret and user agent.
+    """
+    thread_data.reddit = praw.Reddit(**credentials)
+
+
+def search_in_subreddit(subreddit_name, query, limit, time_filter="all"):
+    """
+    Search for a specific string in a single subreddit (excluding image URLs).
+
+    :param subreddit_name: Name of the subreddit to search in.
     :param query: The string to search for.
-    :param limit: Number of results to return per subreddit.
-    :return: List of dictionaries with 'subreddit', 'url', and 'created_utc'
-             as keys containing the subreddit name, URLs of submissions, and creation timestamp.
+    :param limit: Number of results to return.
+    :param time_filter: Time period to search in, one of TIME_FILTERS.
+    :return: List of result dictionaries as returned by search_in_subreddits.
     """
     results = []
-    for subreddit_name in subreddits:
-        subreddit = reddit.subreddit(subreddit_name)
-        for submission in subreddit.search(query, sort="new", limit=limit):
-            # Check if the query string is in the title or selftext (case insensitive)
-            title_contains_query = query.lower() in submission.title.lower()
-            selftext_contains_query = query.lower() in submission.selftext.lower()
-            if title_contains_query or selftext_contains_query:
-                # Check if the URL is not an image URL
-                if not is_image_url(submission.url):
-                    results.append(
-                        {
-                            "subreddit": subreddit_name,
-                            "url": submission.url,
-                            "created_utc": submission.created_utc,
-                        }
-                    )
+    # Let Reddit only return submissions with the query in their title or selftext,
+    # quotes are removed as they would end the phrase, also for the check below
+    phrase = query.replace('"', "")
+    query_lower = phrase.lower()
+    search_query = f'title:"{phrase}" OR selftext:"{phrase}"'
+    subreddit = thread_data.reddit.subreddit(subreddit_name)
+    try:
+        # Reddit drops submissions outside of the time period on the server,
+        # so older submissions are not paged through
+        submissions = list(
+            subreddit.search(
+                search_query, sort="new", time_filter=time_filter, limit=limit
+            )
+        )
+    except (Forbidden, NotFound, Redirect) as e:
+        # Skip private, banned or non-existent subreddits without failing the others
+        print(
+            f"{Fore.RED}Could not search subreddit {subreddit_name}: {e}{Style.RESET_ALL}"
+        )
+        return results
+
+    for submission in submissions:
+        # Check if the query string is in the title or selftext (case insensitive),
+        # as Reddit also matches stemmed words
+        title_contains_query = query_lower in submission.title.lower()
+        selftext_contains_query = query_lower in submission.selftext.lower()
+        if title_contains_query or selftext_contains_query:
+            # Check if the URL is not an image URL
+            if not is_image_url(submission.url):
+                results.append(
+                    {
+                        "subreddit": subreddit_name,
+                        "url": submission.url,
+                        "created_utc": submission.created_utc,
+                    }
+                )
     return results
 
 
-def main(client_id, client_secret, user_agent, subreddits, query, limit):
+def search_in_subreddits(credentials, subreddits, query, limit=10, time_filter="all"):
+    """
+    Search for a specific string in a list of subreddits (excluding image URLs).
+    The subreddits are searched concurrently, each worker thread with its own Reddit instance,
+    and the results of each subreddit are yielded as soon as its search has finished.
+
+    :param credentials: Dictionary with the Reddit API client ID, client secret and user agent.
+    :param subreddits: List of subreddit names to search in.
+    :param query: The string to search for.
+    :param limit: Number of results to return per subreddit.
+    :param time_filter: Time period to search in, one of TIME_FILTERS.
+    :return: Iterator over dictionaries with 'subreddit', 'url', and 'created_utc'
+             as keys containing the subreddit name, URLs of submissions, and creation timestamp.
+    """
+    # A thread pool needs at least one worker, and there is nothing to search anyway
+    if not subreddits:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_WORKERS, len(subreddits)),
+        initializer=init_worker,
+        initargs=(credentials,),
+    ) as executor:
+        futures = [
+            executor.submit(search_in_subreddit, subreddit, query, limit, time_filter)
+            for subreddit in subreddits
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def main(
+    client_id, client_secret, user_agent, subreddits, query, limit, time_filter="all"
+):
     """
     Main function to search Reddit for a specific string in specified subreddits and print results.
 
@@ -62,19 +139,31 @@ def main(client_id, client_secret, user_agent, subreddits, query, limit):
     :param subreddits: Comma-separated list of subreddit names to search in.
     :param query: The string to search for.
     :param limit: Number of results to return per subreddit.
+    :param time_filter: Time period to search in, one of TIME_FILTERS.
     """
-    # Initialize the Reddit client
-    reddit = praw.Reddit(
-        client_id=client_id, client_secret=client_secret, user_agent=user_agent
-    )
-
-    # Convert the comma-separated subreddits string to a list
-    subreddit_list = subreddits.split(",")
+    # Reddit client settings, every worker thread initializes its own client
+    credentials = {
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "user_agent": user_agent,
+    }
+
+    # Convert the comma-separated subreddits string to a list, subreddit names
+    # are case insensitive, so each subreddit is only searched once with the
+    # spelling it was given first
+    unique_subreddits = {}
+    for name in subreddits.split(","):
+        name = name.strip()
+        if name:
+            unique_subreddits.setdefault(name.casefold(), name)
+    subreddit_list = list(unique_subreddits.values())
 
     # Perform the search
-    results = search_in_subreddits(reddit, subreddit_list, query, limit)
+    results = search_in_subreddits(
+        credentials, subreddit_list, query, limit, time_filter
+    )
 
-    # Print the results with formatted output
+    # Print the results with formatted output while the other subreddits are still searched
     for result in results:
         created_utc = result["created_utc"]
         created_datetime_utc = datetime.fromtimestamp(created_utc, tz=timezone.utc)
@@ -113,6 +202,12 @@ if __name__ == "__main__":
         default=10,
         help="Number of results to return per subreddit (default: 10)",
     )
+    parser.add_argument(
+        "--time_filter",
+        choices=TIME_FILTERS,
+        default="all",
+        help="Only search submissions of the last hour, day, week, month or year (default: all)",
+    )
 
     # Parse arguments from command line
     args = parser.parse_args()
@@ -125,4 +220,5 @@ if __name__ == "__main__":
         args.subreddits,
         args.query,
         args.limit,
+        args.time_filter,
     )
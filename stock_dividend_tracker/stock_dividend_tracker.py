@@ -4,11 +4,32 @@
 A script to pull all known Ex-Dividend dates for given stocks through yahoo finance API.
 """
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import repeat
 import argparse
+import requests_cache
 import yfinance as yf
 import yaml
-import pytz
+
+# Parse YAML with the libyaml C bindings if PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Number of stocks to request from Yahoo Finance at the same time
+MAX_WORKERS = 8
+
+# Name of the HTTP cache in the user cache directory and how long Yahoo Finance
+# responses are reused, dividends and calendars change at most daily
+CACHE_NAME = "stock_dividend_tracker"
+CACHE_EXPIRE_AFTER = timedelta(hours=6)
+
+# Period of price history to look for the latest dividend in before
+# downloading the full dividend history, dividends are paid at least yearly
+RECENT_DIVIDENDS_PERIOD = "2y"
 
 
 def load_config(config_file):
@@ -22,72 +43,132 @@ def load_config(config_file):
     dict: A dictionary containing the configuration data.
     """
     with open(config_file, "r", encoding="utf-8") as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=SafeLoader)
     return config
 
 
-def get_dividend_payout_dates(stock_list):
+@lru_cache(maxsize=512)
+def get_ticker(stock, session=None):
     """
-    Get the latest dividend payout dates and predict future dividend payouts
-    based on Ex-Dividend Dates for a list of stocks.
+    Get the yfinance Ticker of a stock, reusing the Ticker of stocks requested before.
+    A Ticker keeps its downloaded dividends and calendar, so each stock is only fetched once.
 
     Parameters:
-    stock_list (list): A list of stock ticker symbols.
+    stock (str): A stock ticker symbol.
+    session (requests.Session, optional): Session to send the requests with.
 
     Returns:
-    dict: A dictionary with stock ticker symbols as keys and their latest dividend payout dates
-    or an error message as values.
+    yfinance.Ticker: The Ticker object of the stock.
+    """
+    return yf.Ticker(stock, session=session)
+
+
+def get_latest_dividends(ticker):
     """
-    payout_dates = {}
-    current_date = datetime.now(pytz.utc)
+    Get the dividends of a stock, only downloading the recent price history if
+    the stock paid dividends within RECENT_DIVIDENDS_PERIOD.
 
-    for stock in stock_list:
-        try:
-            ticker = yf.Ticker(stock)
-            dividends = ticker.dividends
+    Parameters:
+    ticker (yfinance.Ticker): The Ticker object of the stock.
 
+    Returns:
+    pandas.Series: The dividends of the stock indexed by their dates, None if the
+    stock never paid dividends.
+    """
+    # Fall back to the full history for stocks without recent dividends, it is
+    # requested explicitly as ticker.dividends would reuse the recent history
+    for period in (RECENT_DIVIDENDS_PERIOD, "max"):
+        history = ticker.history(period=period)
+        if "Dividends" in history:
+            dividends = history["Dividends"]
+            dividends = dividends[dividends != 0]
             if not dividends.empty:
-                # Get the latest dividend payout date
-                latest_payout_date = dividends.index[-1].to_pydatetime()
-
-                if latest_payout_date < current_date:
-                    latest_payout_date_str = latest_payout_date.strftime("%Y-%m-%d")
-                    payout_dates[stock] = (
-                        "Dividends are in the past, last payout was on "
-                        f"{latest_payout_date_str}."
+                return dividends
+
+    return None
+
+
+def get_dividend_payout_date(stock, current_date, session=None):
+    """
+    Get the latest dividend payout date and predict the future dividend payout
+    based on the Ex-Dividend Date for a single stock.
+
+    Parameters:
+    stock (str): A stock ticker symbol.
+    current_date (datetime): The current date in UTC.
+    session (requests.Session, optional): Session to send the requests with.
+
+    Returns:
+    str: The latest dividend payout date of the stock or an error message.
+    """
+    try:
+        ticker = get_ticker(stock, session)
+        dividends = get_latest_dividends(ticker)
+
+        if dividends is not None:
+            # Get the latest dividend payout date
+            latest_payout_date = dividends.index[-1].to_pydatetime()
+
+            if latest_payout_date < current_date:
+                latest_payout_date_str = latest_payout_date.strftime("%Y-%m-%d")
+                message = (
+                    "Dividends are in the past, last payout was on "
+                    f"{latest_payout_date_str}."
+                )
+            else:
+                message = latest_payout_date.strftime("%Y-%m-%d")
+
+            # Get the next Ex-Dividend Date
+            calendar = ticker.calendar
+            ex_dividend_date = calendar.get("Ex-Dividend Date", None)
+            if ex_dividend_date is not None:
+                if isinstance(ex_dividend_date, list):
+                    ex_dividend_date = ex_dividend_date[0]
+                if isinstance(ex_dividend_date, datetime):
+                    ex_dividend_date = ex_dividend_date.date()
+
+                if ex_dividend_date > current_date.date():
+                    next_ex_dividend_date = ex_dividend_date.strftime("%Y-%m-%d")
+                    message += (
+                        f"\n\033[92mNext Ex-Dividend Date: "
+                        f"{next_ex_dividend_date}\033[0m"
                     )
                 else:
-                    payout_dates[stock] = latest_payout_date.strftime("%Y-%m-%d")
-
-                # Get the next Ex-Dividend Date
-                calendar = ticker.calendar
-                ex_dividend_date = calendar.get("Ex-Dividend Date", None)
-                if ex_dividend_date is not None:
-                    if isinstance(ex_dividend_date, list):
-                        ex_dividend_date = ex_dividend_date[0]
-                    if isinstance(ex_dividend_date, datetime):
-                        ex_dividend_date = ex_dividend_date.date()
-
-                    if ex_dividend_date > current_date.date():
-                        next_ex_dividend_date = ex_dividend_date.strftime("%Y-%m-%d")
-                        payout_dates[stock] += (
-                            f"\n\033[92mNext Ex-Dividend Date: "
-                            f"{next_ex_dividend_date}\033[0m"
-                        )
-                    else:
-                        payout_dates[stock] += "\nNo future Ex-Dividend Date found."
-                else:
-                    payout_dates[
-                        stock
-                    ] += "\nNo Ex-Dividend Date information available."
-
+                    message += "\nNo future Ex-Dividend Date found."
             else:
-                payout_dates[stock] = "No dividends found."
+                message += "\nNo Ex-Dividend Date information available."
+
+        else:
+            message = "No dividends found."
+
+    except Exception as e:
+        message = f"Error: {str(e)}"
+
+    return message
+
+
+def get_dividend_payout_dates(stock_list, session=None):
+    """
+    Get the latest dividend payout dates and predict future dividend payouts
+    based on Ex-Dividend Dates for a list of stocks.
+    The stocks are requested concurrently.
 
-        except Exception as e:
-            payout_dates[stock] = f"Error: {str(e)}"
+    Parameters:
+    stock_list (list): A list of stock ticker symbols.
+    session (requests.Session, optional): Session to send the requests with.
 
-    return payout_dates
+    Returns:
+    dict: A dictionary with stock ticker symbols as keys and their latest dividend payout dates
+    or an error message as values.
+    """
+    # Take the current date once, so all stocks are compared against the same date
+    current_date = datetime.now(timezone.utc)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        messages = executor.map(
+            get_dividend_payout_date, stock_list, repeat(current_date), repeat(session)
+        )
+        return dict(zip(stock_list, messages))
 
 
 def main():
@@ -104,6 +185,11 @@ def main():
     parser.add_argument(
         "--config", type=str, help="Path to the YAML configuration file."
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not reuse or cache Yahoo Finance responses.",
+    )
     parser.add_argument("stocks", nargs="*", help="List of stock tickers.")
 
     # Parse arguments
@@ -120,7 +206,14 @@ def main():
     stocks.extend(args.stocks)
 
     if stocks:
-        dividend_payout_dates = get_dividend_payout_dates(stocks)
+        # Reuse the responses of recent runs from the on-disk HTTP cache
+        session = None
+        if not args.no_cache:
+            session = requests_cache.CachedSession(
+                CACHE_NAME, use_cache_dir=True, expire_after=CACHE_EXPIRE_AFTER
+            )
+
+        dividend_payout_dates = get_dividend_payout_dates(stocks, session)
         for stock, payout_date in dividend_payout_dates.items():
             print(f"\033[1m{stock}\033[0m: {payout_date}\n")
     else: